@@ -11,12 +11,18 @@ Key Features:
 - Fallback to pygame.midi if mido fails
 """
 
+import io
+import mmap
 import os
 import sys
 import time
+import queue
 import argparse
 import signal
 import socket
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Force unbuffered output for better debugging
 if hasattr(sys.stdout, 'reconfigure'):
@@ -45,18 +51,42 @@ try:
 except ImportError:
     OLED_AVAILABLE = False
 
+# libgpiod character-device GPIO (optional; sysfs fallback is kept below)
+try:
+    import gpiod
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
+
 
 # --- Global State ---
-current_channel = None
+note_channels = {}  # {midi_note: pygame.mixer.Channel}, one per mapped key
 midi_port = None  # Global reference for cleanup
+midi_reader = None  # Reader thread; stopped before the port is closed
 _cleanup_done = False  # Prevent double cleanup
 oled = None  # Global reference for OLED display
 amp_pin = None  # GPIO pin number for amplifier enable (None = disabled)
+_amp_chip = None  # gpiod chip handle (character-device path only)
+_amp_line = None  # gpiod line handle (character-device path only)
+_amp_value_fd = None  # persistent sysfs value fd (sysfs fallback only)
 
 # --- Constants ---
 SUPPORTED_EXTENSIONS = ('.wav', '.mp3')
+
+
+def _is_sample_file(name):
+    """True if name has a supported audio extension, in any case mix.
+
+    The upload server lowercases extensions before checking but keeps the
+    original filename, so .WaV/.mP3 etc. must all match. Both extensions
+    are four characters, so only the suffix is lowercased rather than the
+    whole name.
+    """
+    return name[-4:].lower() in SUPPORTED_EXTENSIONS
 DEFAULT_FREQUENCY = 44100
-DEFAULT_BUFFER_SIZE = 2048
+# 512 samples @ 44100Hz is ~12ms of buffer latency (2048 was ~46ms).
+# Raise via --audio-buffer if the board underruns.
+DEFAULT_BUFFER_SIZE = 512
 
 # Mapping from Folder Name to MIDI Note
 # Key1 -> 50, Key2 -> 51, etc.
@@ -79,6 +109,15 @@ NOTE_MAPPING = {
 NOTE_TO_KEY = {v: k for k, v in NOTE_MAPPING.items()}
 STOP_KEY_NAME = "Key1"
 
+# Flat dispatch table indexed by MIDI note (0-127): None for unmapped notes,
+# otherwise ('stop'|'play', key_name, channel). One list index replaces the
+# dict membership test, dict lookup, and string compare in the note-on hot
+# path. The channel slot is filled in by initialize_audio.
+_NOTE_ACTION = [None] * 128
+for _note, _key in NOTE_TO_KEY.items():
+    _NOTE_ACTION[_note] = ('stop' if _key == STOP_KEY_NAME else 'play', _key, None)
+del _note, _key
+
 # Default GPIO for amplifier SD pin: PC9 = (2 * 32) + 9 = 73
 DEFAULT_AMP_GPIO = 73
 
@@ -111,9 +150,76 @@ def gpio_unexport(pin):
         pass
 
 
+def amp_setup(pin):
+    """Claim the amplifier GPIO as an output driven LOW.
+
+    Prefers the libgpiod character-device API: the line is requested once
+    and each toggle is a single ioctl on a held fd, instead of the
+    open/write/close (plus path walk) that deprecated sysfs costs per call.
+    Falls back to sysfs when gpiod isn't installed.
+    """
+    global _amp_chip, _amp_line, _amp_value_fd
+
+    if GPIOD_AVAILABLE:
+        try:
+            chip = gpiod.Chip("gpiochip0")
+            line = chip.get_line(pin)
+            line.request(consumer="jingle-amp",
+                         type=gpiod.LINE_REQ_DIR_OUT,
+                         default_vals=[0])
+            _amp_chip = chip
+            _amp_line = line
+            return
+        except Exception as e:
+            print(f"   [WARN] libgpiod unavailable ({e}), using sysfs")
+    gpio_export(pin)
+    # Keep the value file open for the pin's lifetime: toggles become a
+    # write+seek on a held fd instead of open/write/close plus a path walk.
+    try:
+        _amp_value_fd = os.open(f"/sys/class/gpio/gpio{pin}/value", os.O_WRONLY)
+    except OSError:
+        _amp_value_fd = None  # gpio_set fallback still works
+
+
+def amp_set(pin, value):
+    """Drive the amplifier enable line HIGH (1) or LOW (0)."""
+    if _amp_line is not None:
+        _amp_line.set_value(value)
+    elif _amp_value_fd is not None:
+        os.write(_amp_value_fd, b'1' if value else b'0')
+        os.lseek(_amp_value_fd, 0, os.SEEK_SET)
+    else:
+        gpio_set(pin, value)
+
+
+def amp_release(pin):
+    """Release whichever GPIO interface amp_setup claimed."""
+    global _amp_chip, _amp_line, _amp_value_fd
+
+    if _amp_line is not None:
+        try:
+            _amp_line.release()
+        except Exception:
+            pass
+        _amp_line = None
+        try:
+            _amp_chip.close()
+        except Exception:
+            pass
+        _amp_chip = None
+    else:
+        if _amp_value_fd is not None:
+            try:
+                os.close(_amp_value_fd)
+            except OSError:
+                pass
+            _amp_value_fd = None
+        gpio_unexport(pin)
+
+
 def cleanup_resources():
     """Cleanup function to release MIDI device. Safe to call multiple times."""
-    global midi_port, _cleanup_done, oled, amp_pin
+    global midi_port, midi_reader, _cleanup_done, oled, amp_pin
 
     if _cleanup_done:
         return
@@ -124,12 +230,19 @@ def cleanup_resources():
     # 1. Disable amplifier FIRST (before audio shutdown to avoid pop)
     if amp_pin is not None:
         try:
-            gpio_set(amp_pin, 0)
+            amp_set(amp_pin, 0)
             print("   [OK] Amplifier disabled.")
         except Exception:
             pass
 
-    # 2. Close MIDI port
+    # 2. Stop the reader thread BEFORE touching the port: closing the
+    # device while the reader is inside a portmidi read is a crash race.
+    if midi_reader is not None:
+        midi_reader.stop()
+        midi_reader.join(timeout=1.0)
+        midi_reader = None
+
+    # 3. Close MIDI port
     if midi_port is not None:
         try:
             midi_port.close()
@@ -138,7 +251,7 @@ def cleanup_resources():
             print(f"   [WARN] MIDI port close error: {e}")
         midi_port = None
 
-    # 3. Quit pygame.midi
+    # 4. Quit pygame.midi
     try:
         if pygame.midi.get_init():
             pygame.midi.quit()
@@ -146,7 +259,7 @@ def cleanup_resources():
     except Exception:
         pass
 
-    # 4. Quit pygame.mixer
+    # 5. Quit pygame.mixer
     try:
         if pygame.mixer.get_init():
             pygame.mixer.quit()
@@ -154,22 +267,22 @@ def cleanup_resources():
     except Exception:
         pass
 
-    # 5. Full pygame quit
+    # 6. Full pygame quit
     try:
         pygame.quit()
     except Exception:
         pass
 
-    # 6. Release amplifier GPIO
+    # 7. Release amplifier GPIO
     if amp_pin is not None:
         try:
-            gpio_unexport(amp_pin)
+            amp_release(amp_pin)
             print("   [OK] Amplifier GPIO released.")
         except Exception:
             pass
         amp_pin = None
 
-    # 7. Clear OLED display
+    # 8. Clear OLED display
     if oled is not None:
         try:
             oled.clear()
@@ -200,23 +313,34 @@ def setup_signal_handlers():
         signal.signal(signal.SIGBREAK, signal_handler)
 
 
-def initialize_audio():
+def initialize_audio(buffer_size=DEFAULT_BUFFER_SIZE):
     """Initializes pygame.mixer for audio playback."""
-    global current_channel
-    
+    global note_channels
+
     print("\n[INIT] Initializing Pygame Mixer...")
     try:
         # Initialize pygame first
         pygame.init()
-        
+
         # Configure mixer for low-latency audio
         pygame.mixer.init(
-            frequency=DEFAULT_FREQUENCY, 
-            buffer=DEFAULT_BUFFER_SIZE
+            frequency=DEFAULT_FREQUENCY,
+            buffer=buffer_size
         )
-        # Get a specific channel for controlled monophonic playback
-        current_channel = pygame.mixer.Channel(0) 
-        print(f"   [OK] Mixer ready: {DEFAULT_FREQUENCY}Hz, {DEFAULT_BUFFER_SIZE} buffer")
+        # Preallocate one Channel per mapped key: keys play polyphonically
+        # and the note-on path never needs a stop() call first.
+        pygame.mixer.set_num_channels(16)
+        note_channels = {
+            note: pygame.mixer.Channel(i)
+            for i, note in enumerate(sorted(NOTE_MAPPING.values()))
+        }
+        # Fold each key's channel into the dispatch table, so note-on is a
+        # single list index followed by Channel.play.
+        for note, channel in note_channels.items():
+            kind, key_name, _ = _NOTE_ACTION[note]
+            _NOTE_ACTION[note] = (kind, key_name, channel)
+        print(f"   [OK] Mixer ready: {DEFAULT_FREQUENCY}Hz, {buffer_size} buffer, "
+              f"{len(note_channels)} channels")
         return True
     except pygame.error as e:
         print(f"   [FAIL] Mixer error: {e}")
@@ -268,37 +392,46 @@ def initialize_midi():
     return None
 
 
+# Status-byte high nibble -> message type. A dict probe replaces the
+# if/elif chain in the poll path.
+_MSG_TYPE_DISPATCH = {
+    0x90: 'note_on',
+    0x80: 'note_off',
+}
+
+
 class PygameMidiWrapper:
     """Wrapper to make pygame.midi.Input compatible with mido interface."""
-    
+
     def __init__(self, pygame_input, name):
         self._input = pygame_input
         self.name = name
         self._closed = False
-    
+
+    READ_BATCH = 64  # events drained per read() call
+
     def poll(self):
-        """Poll for MIDI messages."""
+        """Drain pending MIDI events. Returns a list of MidiMessage.
+
+        Each pygame.midi.Input.read crosses the C boundary and takes a
+        lock, so draining up to READ_BATCH events per call amortises that
+        cost instead of paying it once per event. Port errors propagate to
+        the caller: the reader thread owns the error counting and backoff,
+        and swallowing them here would make a dead port look idle.
+        """
         if self._closed:
-            return None
-        try:
-            if self._input.poll():
-                events = self._input.read(1)
-                if events:
-                    midi_data = events[0][0]
-                    status = midi_data[0]
-                    data1 = midi_data[1]
-                    data2 = midi_data[2]
-                    
-                    msg_type = status & 0xF0
-                    channel = status & 0x0F
-                    
-                    if msg_type == 0x90:  # Note On
-                        return MidiMessage('note_on', note=data1, velocity=data2, channel=channel)
-                    elif msg_type == 0x80:  # Note Off
-                        return MidiMessage('note_off', note=data1, velocity=data2, channel=channel)
-        except Exception as e:
-            print(f"[ERROR] MIDI poll error: {e}")
-        return None
+            return []
+        if not self._input.poll():
+            return []
+        events = self._input.read(self.READ_BATCH)
+        messages = []
+        for event in events:
+            midi_data = event[0]
+            status = midi_data[0]
+            msg_type = _MSG_TYPE_DISPATCH.get(status & 0xF0)
+            if msg_type is not None:
+                messages.append(MidiMessage(msg_type, midi_data[1], midi_data[2], status & 0x0F))
+        return messages
     
     def close(self):
         """Close the MIDI input."""
@@ -311,12 +444,70 @@ class PygameMidiWrapper:
 
 
 class MidiMessage:
-    """Simple MIDI message class compatible with mido messages."""
+    """Simple MIDI message class compatible with mido messages.
+
+    __slots__ keeps these allocation-light since one is built per event.
+    """
+
+    __slots__ = ('type', 'note', 'velocity', 'channel')
 
-    def __init__(self, msg_type, **kwargs):
+    def __init__(self, msg_type, note, velocity, channel):
         self.type = msg_type
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self.note = note
+        self.velocity = velocity
+        self.channel = channel
+
+
+class MidiReaderThread(threading.Thread):
+    """Polls the MIDI port in a tight loop and queues messages for the main loop.
+
+    Moving the poll off the main loop means the main loop only wakes up when
+    an actual event arrives, instead of spinning every millisecond.
+    """
+
+    POLL_INTERVAL = 0.0005  # keep the poll tight on the reader side
+    IDLE_POLL_INTERVAL = 0.005  # relaxed poll once the keyboard goes quiet
+    IDLE_THRESHOLD = 2000  # empty polls (~1s) before relaxing
+    ERROR_BACKOFF_THRESHOLD = 50  # consecutive errors before backing off
+
+    def __init__(self, port, out_queue):
+        super().__init__(daemon=True, name="midi-reader")
+        self._port = port
+        self._queue = out_queue
+        self._stop_event = threading.Event()
+
+    def run(self):
+        consecutive_errors = 0
+        empty_polls = 0
+        while not self._stop_event.is_set():
+            try:
+                msgs = self._port.poll()
+            except Exception as e:
+                print(f"[ERROR] MIDI reader error: {e}")
+                consecutive_errors += 1
+                # A transient error shouldn't cost events; only back off
+                # once the port looks persistently broken.
+                if consecutive_errors >= self.ERROR_BACKOFF_THRESHOLD:
+                    time.sleep(0.01)
+                continue
+            consecutive_errors = 0
+            if msgs:
+                empty_polls = 0
+                for msg in msgs:
+                    self._queue.put(msg)
+            else:
+                # Poll tightly while someone is playing; once the port has
+                # been quiet for a while, relax the cadence to cut idle
+                # CPU wakeups by ~10x. Worst case this adds 5ms to the
+                # first note after a long pause.
+                empty_polls += 1
+                if empty_polls < self.IDLE_THRESHOLD:
+                    time.sleep(self.POLL_INTERVAL)
+                else:
+                    time.sleep(self.IDLE_POLL_INTERVAL)
+
+    def stop(self):
+        self._stop_event.set()
 
 
 class OledDisplay:
@@ -370,6 +561,21 @@ class OledDisplay:
         self.font_bold = self._load_font(self._BOLD_FONTS, 14)
         self.font = self._load_font(self._REGULAR_FONTS, 14)
 
+        # The yellow-zone title never changes: rasterise it once and start
+        # every frame from a copy of this bitmap (a 1KB memcpy) instead of
+        # re-running the TrueType draw each refresh.
+        self._base = Image.new("1", (self.WIDTH, self.HEIGHT), 0)
+        self._draw_title(ImageDraw.Draw(self._base))
+        self._text_x_cache = {}  # {(text, font): centered x position}
+
+        self._progress_cache = (None, None)  # (label, title+label+outline frame)
+        self._last_frame = None  # framebuffer bytes last pushed to the bus
+        self._status_lock = threading.Lock()
+        self._status_timer = None  # pending coalescing timer
+        # Serializes draw-and-push: a refresh ships ~25ms of I2C traffic,
+        # and interleaved device writes from two threads corrupt the panel.
+        self._render_lock = threading.Lock()
+
         self._ip = self._get_ip()
         self._web_port = web_port
         self._status = "Ready"
@@ -397,70 +603,126 @@ class OledDisplay:
         draw.text((x, -1), text, fill=1, font=self.font_title)
 
     def _center_text(self, draw, y, text, font=None):
-        """Draw text horizontally centered at given y."""
+        """Draw text horizontally centered at given y.
+
+        Centered x positions are memoised per (text, font): recurring
+        strings like "Ready" skip the FreeType metric lookup entirely.
+        """
         font = font or self.font
-        bbox = draw.textbbox((0, 0), text, font=font)
-        tw = bbox[2] - bbox[0]
-        x = (self.WIDTH - tw) // 2
+        cache_key = (text, font)
+        x = self._text_x_cache.get(cache_key)
+        if x is None:
+            bbox = draw.textbbox((0, 0), text, font=font)
+            tw = bbox[2] - bbox[0]
+            x = (self.WIDTH - tw) // 2
+            self._text_x_cache[cache_key] = x
         draw.text((x, y), text, fill=1, font=font)
 
-    def show_splash(self):
-        """Show splash: title in yellow, empty blue area."""
-        img = Image.new("1", (self.WIDTH, self.HEIGHT), 0)
-        draw = ImageDraw.Draw(img)
-        self._draw_title(draw)
-        self.device.display(img)
+    def _push(self, img):
+        """Send a frame to the device, skipping identical framebuffers.
 
-    def show_progress(self, label, percent):
-        """Show title + progress bar with label in blue area."""
-        img = Image.new("1", (self.WIDTH, self.HEIGHT), 0)
-        draw = ImageDraw.Draw(img)
-
-        # Yellow zone: title
-        self._draw_title(draw)
-
-        # Blue zone: label + progress bar
-        self._center_text(draw, self.BLUE_Y + 4, label)
+        A full refresh ships 1KB over I2C (~25ms of bus time at 400kHz),
+        so redraws that changed nothing are dropped before touching the bus.
+        """
+        data = img.tobytes()
+        if data == self._last_frame:
+            return
+        self._last_frame = data
+        self.device.display(img)
 
-        bar_x, bar_w, bar_h = 4, 120, 10
-        bar_y = self.BLUE_Y + 26
-        draw.rectangle([bar_x, bar_y, bar_x + bar_w, bar_y + bar_h], outline=1)
+    def show_splash(self):
+        """Show splash: title in yellow, empty blue area."""
+        with self._render_lock:
+            self._push(self._base)
 
-        fill_w = int(bar_w * min(percent, 100) / 100)
-        if fill_w > 0:
-            draw.rectangle([bar_x, bar_y, bar_x + fill_w, bar_y + bar_h], fill=1)
+    BAR_X, BAR_W, BAR_H = 4, 120, 10
 
-        self.device.display(img)
+    def show_progress(self, label, percent):
+        """Show title + progress bar with label in blue area.
 
-    def set_status(self, status):
-        """Update status line and refresh display."""
-        self._status = status
+        Title, label, and bar outline only change when the label does, so
+        that frame is cached per label; each percentage tick then costs a
+        1KB copy plus a single fill rectangle.
+        """
+        with self._render_lock:
+            bar_y = self.BLUE_Y + 26
+            cached_label, frame = self._progress_cache
+            if frame is None or cached_label != label:
+                frame = self._base.copy()
+                draw = ImageDraw.Draw(frame)
+                self._center_text(draw, self.BLUE_Y + 4, label)
+                draw.rectangle(
+                    [self.BAR_X, bar_y, self.BAR_X + self.BAR_W, bar_y + self.BAR_H],
+                    outline=1)
+                self._progress_cache = (label, frame)
+
+            img = frame.copy()
+            fill_w = int(self.BAR_W * min(percent, 100) / 100)
+            if fill_w > 0:
+                ImageDraw.Draw(img).rectangle(
+                    [self.BAR_X, bar_y, self.BAR_X + fill_w, bar_y + self.BAR_H],
+                    fill=1)
+
+            self._push(img)
+
+    STATUS_COALESCE_S = 0.05  # window for merging rapid status updates
+
+    def set_status(self, status, immediate=False):
+        """Update status line and refresh display.
+
+        Refreshes are coalesced: rapid back-to-back updates (retriggered
+        keys) arm one short timer and only the final status is drawn, so
+        the I2C transfer stays off the note-on hot path. Pass
+        immediate=True to draw synchronously instead - needed on exit
+        paths, where the interpreter would die before the timer fires.
+        """
+        with self._status_lock:
+            self._status = status
+            if immediate:
+                if self._status_timer is not None:
+                    self._status_timer.cancel()
+                    self._status_timer = None
+            elif self._status_timer is None:
+                self._status_timer = threading.Timer(
+                    self.STATUS_COALESCE_S, self._flush_status)
+                self._status_timer.daemon = True
+                self._status_timer.start()
+        if immediate:
+            self._render()
+
+    def _flush_status(self):
+        """Timer callback: draw whatever status was set last."""
+        with self._status_lock:
+            self._status_timer = None
         self._render()
 
     def _render(self):
         """Redraw: title in yellow, IP + status centered in blue."""
-        img = Image.new("1", (self.WIDTH, self.HEIGHT), 0)
-        draw = ImageDraw.Draw(img)
-
-        # Yellow zone: title
-        self._draw_title(draw)
+        with self._render_lock:
+            img = self._base.copy()
+            draw = ImageDraw.Draw(img)
 
-        # Blue zone: IP (regular) + status (bold), vertically centered
-        if self._ip:
-            ip_line = self._ip if self._web_port == 80 else f"{self._ip}:{self._web_port}"
-        else:
-            ip_line = "No IP address !"
-        self._center_text(draw, self.BLUE_Y + 8, ip_line)
-        self._center_text(draw, self.BLUE_Y + 28, self._status, font=self.font_bold)
+            # Blue zone: IP (regular) + status (bold), vertically centered
+            if self._ip:
+                ip_line = self._ip if self._web_port == 80 else f"{self._ip}:{self._web_port}"
+            else:
+                ip_line = "No IP address !"
+            self._center_text(draw, self.BLUE_Y + 8, ip_line)
+            self._center_text(draw, self.BLUE_Y + 28, self._status, font=self.font_bold)
 
-        self.device.display(img)
+            self._push(img)
 
     def clear(self):
         """Turn off the display."""
-        try:
-            self.device.hide()
-        except Exception:
-            pass
+        with self._status_lock:
+            if self._status_timer is not None:
+                self._status_timer.cancel()
+                self._status_timer = None
+        with self._render_lock:
+            try:
+                self.device.hide()
+            except Exception:
+                pass
 
 
 def get_default_uploads_dir():
@@ -473,7 +735,11 @@ def get_default_uploads_dir():
 
 
 def get_sample_folder_path(args_path=None):
-    """Determines the sample folder path."""
+    """Determines the sample folder path, or None if none is available.
+
+    Never prompts: the target device boots headless, and waiting on stdin
+    would stall startup indefinitely.
+    """
     if args_path and os.path.isdir(args_path):
         return args_path
 
@@ -482,11 +748,51 @@ def get_sample_folder_path(args_path=None):
         print(f"\n[AUTO] Found uploads: {default_path}")
         return default_path
 
-    while True:
-        folder_path = input("\nEnter path to audio samples folder: ").strip()
-        if os.path.isdir(folder_path):
-            return folder_path
-        print(f"Invalid path: '{folder_path}'")
+    return None
+
+
+def _prefetch_samples(folder_path):
+    """Warm the page cache by reading every sample file once.
+
+    Runs on a background thread during hardware/web init so the decodes in
+    the initial scan hit cached pages instead of waiting on the SD card.
+    """
+    for root, _dirs, files in os.walk(folder_path):
+        for name in files:
+            if not _is_sample_file(name):
+                continue
+            try:
+                with open(os.path.join(root, name), 'rb') as f:
+                    while f.read(1 << 20):
+                        pass
+            except OSError:
+                continue
+
+
+def _read_sample_buffer(path):
+    """Open a sample as a file-like buffer for decoding.
+
+    The file is mmap'd rather than read, so the encoded bytes stay backed
+    by the kernel page cache instead of being copied onto the process heap,
+    and posix_fadvise tells the kernel to start reading them in. mmap
+    objects support read/seek/tell, so pygame decodes them like any file.
+    Falls back to an in-memory copy when mapping fails (e.g. empty files).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+        try:
+            # The mapping stays valid after the fd is closed below.
+            return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            with os.fdopen(os.dup(fd), 'rb') as f:
+                return io.BytesIO(f.read())
+    finally:
+        os.close(fd)
 
 
 class SampleLoader:
@@ -494,43 +800,79 @@ class SampleLoader:
 
     def __init__(self, folder_path):
         self.folder_path = folder_path
+        # Key-folder paths never change after construction; join them once.
+        self._key_dirs = {key: os.path.join(folder_path, key) for key in NOTE_MAPPING}
         self.samples = {}  # {midi_note: pygame.mixer.Sound}
-        self._file_cache = {}  # {midi_note: (file_path, mtime)}
-        self._last_scan_time = 0
+        self._file_cache = {}  # {midi_note: (file_path, mtime_ns)}
+        self._dir_mtime_ns = {}  # {key_folder: directory mtime at last scan}
+        self._retired_samples = {}  # previous mapping, kept one scan cycle
+        self._sound_cache = OrderedDict()  # {(path, mtime, size): Sound} LRU
+        self._sound_cache_max = 32
+        self._pool = ThreadPoolExecutor(max_workers=4)  # parallel file reads
         self.scan_interval = 2.0  # Seconds between scans
 
     def count_samples(self):
         """Count how many sample files exist (fast scan, no loading)."""
         count = 0
         for key_folder in NOTE_MAPPING:
-            target_dir = os.path.join(self.folder_path, key_folder)
-            if os.path.isdir(target_dir):
-                try:
-                    for f in os.listdir(target_dir):
-                        if f.lower().endswith(SUPPORTED_EXTENSIONS):
+            target_dir = self._key_dirs[key_folder]
+            try:
+                with os.scandir(target_dir) as it:
+                    for entry in it:
+                        if _is_sample_file(entry.name):
                             count += 1
                             break  # one sample per key
-                except OSError:
-                    pass
+            except OSError:
+                pass
         return count
 
     def _find_sample_file(self, key_folder):
-        """Find the audio file for a key folder. Returns (path, mtime) or (None, 0)."""
-        target_dir = os.path.join(self.folder_path, key_folder)
-        if not os.path.isdir(target_dir):
-            return None, 0
+        """Find the audio file for a key folder.
+
+        Returns (path, mtime_ns, size) or (None, 0, 0). Modification times
+        are integer nanoseconds: comparing them is exact, unlike the float
+        seconds from getmtime, which can round differently across
+        filesystems and trigger spurious reloads.
+        """
+        target_dir = self._key_dirs[key_folder]
         try:
             valid_files = []
-            for f in os.listdir(target_dir):
-                if f.lower().endswith(SUPPORTED_EXTENSIONS):
-                    full_path = os.path.join(target_dir, f)
-                    valid_files.append((full_path, os.path.getmtime(full_path)))
+            with os.scandir(target_dir) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith('.') or not _is_sample_file(name):
+                        continue
+                    # DirEntry.stat() reuses the data scandir already fetched,
+                    # so this costs no extra syscall on Linux.
+                    st = entry.stat()
+                    valid_files.append((entry.path, st.st_mtime_ns, st.st_size))
             valid_files.sort(key=lambda x: x[0])
             if valid_files:
                 return valid_files[0]
         except OSError:
             pass
-        return None, 0
+        return None, 0, 0
+
+    def _load_sound(self, path, mtime_ns, size, buf=None):
+        """Decode a sample, reusing a previously decoded Sound when possible.
+
+        Args:
+            buf: optional in-memory file object with the sample bytes,
+                 pre-staged by the read pool.
+        """
+        cache_key = (path, mtime_ns, size)
+        sound = self._sound_cache.get(cache_key)
+        if sound is not None:
+            self._sound_cache.move_to_end(cache_key)
+            return sound
+        if buf is not None:
+            sound = pygame.mixer.Sound(file=buf)
+        else:
+            sound = pygame.mixer.Sound(path)
+        self._sound_cache[cache_key] = sound
+        while len(self._sound_cache) > self._sound_cache_max:
+            self._sound_cache.popitem(last=False)
+        return sound
 
     def scan_and_update(self, on_progress=None):
         """Scans directories and updates samples if changes detected.
@@ -539,41 +881,91 @@ class SampleLoader:
             on_progress: optional callback(loaded_index, total) called after
                          each key is processed. Only used during initial load.
         """
-        current_time = time.time()
-        if on_progress is None and current_time - self._last_scan_time < self.scan_interval:
-            return False
-
-        self._last_scan_time = current_time
         changes_detected = False
         items = list(NOTE_MAPPING.items())
         total = len(items)
-
-        for idx, (key_folder, midi_note) in enumerate(items):
-            current_file, current_mtime = self._find_sample_file(key_folder)
+        new_samples = dict(self.samples)
+
+        # Pass 1: locate the current sample file for every key. On
+        # background rescans a key directory whose mtime hasn't moved is
+        # skipped without listing it — uploads, replacements, and deletes
+        # all create or remove entries and therefore bump the dir mtime.
+        # The skip still stats the cached file itself: multer creates the
+        # destination entry up front and streams the upload into it, so a
+        # finishing upload changes the file without touching the dir mtime.
+        found = {}  # {midi_note: (path, mtime_ns, size)}
+        for key_folder, midi_note in items:
+            try:
+                dir_mtime_ns = os.stat(self._key_dirs[key_folder]).st_mtime_ns
+            except OSError:
+                dir_mtime_ns = -1  # missing directory
+            if on_progress is None and dir_mtime_ns == self._dir_mtime_ns.get(key_folder):
+                cached_info = self._file_cache.get(midi_note)
+                if cached_info:
+                    try:
+                        if os.stat(cached_info[0]).st_mtime_ns == cached_info[1]:
+                            continue
+                    except OSError:
+                        pass  # cached file vanished; relist the directory
+                    found[midi_note] = self._find_sample_file(key_folder)
+                continue
+            self._dir_mtime_ns[key_folder] = dir_mtime_ns
+            found[midi_note] = self._find_sample_file(key_folder)
+
+        # Pre-stage raw bytes for stale files on the pool so disk reads
+        # overlap each other and the decodes below, instead of running
+        # strictly read-decode-read-decode.
+        pending = {}  # {path: Future -> io.BytesIO}
+        for midi_note, (path, mtime_ns, size) in found.items():
+            if path is None:
+                continue
             cached_info = self._file_cache.get(midi_note)
+            if ((not cached_info or cached_info != (path, mtime_ns))
+                    and (path, mtime_ns, size) not in self._sound_cache):
+                pending[path] = self._pool.submit(_read_sample_buffer, path)
 
-            # Case 1: New file or file changed
-            if current_file:
-                if (not cached_info) or (cached_info[0] != current_file) or (cached_info[1] != current_mtime):
-                    try:
-                        print(f"[RELOAD] Loading {key_folder}: {os.path.basename(current_file)}")
-                        sound = pygame.mixer.Sound(current_file)
-                        self.samples[midi_note] = sound
-                        self._file_cache[midi_note] = (current_file, current_mtime)
-                        changes_detected = True
-                    except (pygame.error, OSError) as e:
-                        print(f"[ERROR] Failed to load {current_file}: {e}")
-
-            # Case 2: File removed
-            elif cached_info:
-                print(f"[REMOVE] Unloaded sample for {key_folder}")
-                self.samples.pop(midi_note, None)
-                self._file_cache.pop(midi_note, None)
-                changes_detected = True
+        # Pass 2: apply reloads and removals for the keys that were scanned.
+        for idx, (key_folder, midi_note) in enumerate(items):
+            if midi_note in found:
+                current_file, current_mtime_ns, current_size = found[midi_note]
+                cached_info = self._file_cache.get(midi_note)
+
+                # Case 1: New file or file changed
+                if current_file:
+                    if (not cached_info) or (cached_info[0] != current_file) or (cached_info[1] != current_mtime_ns):
+                        try:
+                            print(f"[RELOAD] Loading {key_folder}: {os.path.basename(current_file)}")
+                            future = pending.get(current_file)
+                            buf = future.result() if future is not None else None
+                            sound = self._load_sound(current_file, current_mtime_ns, current_size, buf)
+                            new_samples[midi_note] = sound
+                            self._file_cache[midi_note] = (current_file, current_mtime_ns)
+                            changes_detected = True
+                        except (pygame.error, OSError) as e:
+                            print(f"[ERROR] Failed to load {current_file}: {e}")
+                            # Forget the dir mtime so the next scan relists
+                            # and retries (the file may still be mid-upload)
+                            # instead of short-circuiting past the failure.
+                            self._dir_mtime_ns.pop(key_folder, None)
+
+                # Case 2: File removed
+                elif cached_info:
+                    print(f"[REMOVE] Unloaded sample for {key_folder}")
+                    new_samples.pop(midi_note, None)
+                    self._file_cache.pop(midi_note, None)
+                    changes_detected = True
 
             if on_progress:
                 on_progress(idx + 1, total)
 
+        if changes_detected:
+            # Publish the fully-built mapping in one assignment so the MIDI
+            # thread never sees a half-updated dict. Hold the old mapping
+            # until the next cycle so a Sound still playing isn't freed
+            # while the mixer reads its buffer.
+            self._retired_samples = self.samples
+            self.samples = new_samples
+
         return changes_detected
 
     def get_sample(self, midi_note):
@@ -582,39 +974,34 @@ class SampleLoader:
 
 def handle_midi_message(msg, loader, oled=None):
     """Processes incoming MIDI messages."""
-    global current_channel
-    
-    if msg.type not in ['note_on', 'note_off']:
+    if msg.type != 'note_on' or msg.velocity == 0:
         return
 
     midi_note = msg.note
-    
-    if msg.type == 'note_on' and msg.velocity > 0:
-        if midi_note in NOTE_TO_KEY:
-            key_name = NOTE_TO_KEY[midi_note]
-
-            # STOP COMMAND
-            if key_name == STOP_KEY_NAME:
-                if current_channel and current_channel.get_busy():
-                    current_channel.stop()
-                print(f"[STOP] {key_name}")
-                if oled:
-                    oled.set_status("Ready")
-                return
-
-            # PLAY COMMAND
-            sound = loader.get_sample(midi_note)
-            if sound:
-                if current_channel and current_channel.get_busy():
-                    current_channel.stop()
-                current_channel.play(sound)
-                print(f"[PLAY] {key_name} (Note {midi_note}, Vel: {msg.velocity})")
-                if oled:
-                    oled.set_status(f"Playing {key_name}")
-            else:
-                print(f"[SKIP] {key_name} - no sample")
-        else:
-            print(f"[SKIP] Note {midi_note} - not mapped")
+    action = _NOTE_ACTION[midi_note] if 0 <= midi_note < 128 else None
+    if action is None:
+        print(f"[SKIP] Note {midi_note} - not mapped")
+        return
+
+    kind, key_name, channel = action
+
+    # STOP COMMAND (kills playback on every channel)
+    if kind == 'stop':
+        pygame.mixer.stop()
+        print(f"[STOP] {key_name}")
+        if oled:
+            oled.set_status("Ready")
+        return
+
+    # PLAY COMMAND (retriggering a key restarts only its own channel)
+    sound = loader.samples.get(midi_note)
+    if sound:
+        channel.play(sound)
+        print(f"[PLAY] {key_name} (Note {midi_note}, Vel: {msg.velocity})")
+        if oled:
+            oled.set_status(f"Playing {key_name}")
+    else:
+        print(f"[SKIP] {key_name} - no sample")
 
 
 def main(pre_load_hook=None):
@@ -624,7 +1011,7 @@ def main(pre_load_hook=None):
         pre_load_hook: Optional callable to run before loading samples
                        (e.g. starting the web server from run.py).
     """
-    global midi_port, amp_pin
+    global midi_port, midi_reader, amp_pin
 
     # Setup signal handlers FIRST
     setup_signal_handlers()
@@ -637,6 +1024,8 @@ def main(pre_load_hook=None):
                         help="I2C address for OLED display (default: 0x3C)")
     parser.add_argument("--no-oled", action="store_true",
                         help="Disable OLED display")
+    parser.add_argument("--audio-buffer", type=int, default=DEFAULT_BUFFER_SIZE,
+                        help=f"Mixer buffer size in samples (default: {DEFAULT_BUFFER_SIZE})")
     parser.add_argument("--amp-pin", type=int, default=DEFAULT_AMP_GPIO,
                         help=f"GPIO pin for amplifier enable/SD (default: {DEFAULT_AMP_GPIO} = PC9)")
     parser.add_argument("--no-amp", action="store_true",
@@ -662,22 +1051,35 @@ def main(pre_load_hook=None):
         elif not OLED_AVAILABLE:
             print("   [INFO] luma.oled not installed, OLED disabled")
 
-        # 2. Setup amplifier GPIO (keep disabled during audio init)
+        # 2. Resolve the samples folder early and start warming the page
+        # cache in the background, so the initial sample load later in the
+        # ladder reads from memory instead of the SD card.
+        folder_path = get_sample_folder_path(args.dir)
+        if folder_path is None:
+            print("\n[ERROR] No samples directory found (pass --dir)!")
+            if oled:
+                oled.set_status("No samples dir", immediate=True)
+            cleanup_resources()
+            sys.exit(2)
+        threading.Thread(target=_prefetch_samples, args=(folder_path,),
+                         daemon=True, name="sample-prefetch").start()
+
+        # 3. Setup amplifier GPIO (keep disabled during audio init)
         if oled:
             oled.show_progress("Init hardware...", 4)
         if not args.no_amp:
             try:
-                gpio_export(args.amp_pin)
+                amp_setup(args.amp_pin)
                 amp_pin = args.amp_pin
                 print(f"   [OK] Amplifier GPIO {amp_pin} ready (disabled)")
             except Exception as e:
                 print(f"   [WARN] Amplifier GPIO not available: {e}")
                 amp_pin = None
 
-        # 3. Initialize Audio
+        # 4. Initialize Audio
         if oled:
             oled.show_progress("Init audio...", 8)
-        if not initialize_audio():
+        if not initialize_audio(args.audio_buffer):
             print("\n[ERROR] Failed to initialize audio!")
             cleanup_resources()
             sys.exit(1)
@@ -685,10 +1087,10 @@ def main(pre_load_hook=None):
         # Enable amplifier now that audio is settled
         if amp_pin is not None:
             time.sleep(0.1)  # brief settle time
-            gpio_set(amp_pin, 1)
+            amp_set(amp_pin, 1)
             print("   [OK] Amplifier enabled.")
 
-        # 4. Initialize MIDI
+        # 5. Initialize MIDI
         if oled:
             oled.show_progress("Init MIDI...", 11)
         midi_port = initialize_midi()
@@ -705,16 +1107,15 @@ def main(pre_load_hook=None):
             cleanup_resources()
             sys.exit(1)
 
-        # 5. Run pre-load hook (e.g. start web server)
+        # 6. Run pre-load hook (e.g. start web server)
         if pre_load_hook:
             if oled:
                 oled.show_progress("Init Web UI...", 15)
             pre_load_hook()
 
-        # 6. Load Samples (20% to 100% of progress bar)
+        # 7. Load Samples (20% to 100% of progress bar)
         if oled:
             oled.show_progress("Loading samples...", 20)
-        folder_path = get_sample_folder_path(args.dir)
         loader = SampleLoader(folder_path)
 
         def _on_sample_progress(loaded, total):
@@ -732,28 +1133,50 @@ def main(pre_load_hook=None):
             time.sleep(0.5)
             oled.set_status("Ready")
 
-        # 4. Main Loop
+        # 8. Main Loop
         print("\n" + "=" * 50)
         print("*** READY - Waiting for MIDI input ***")
         print("=" * 50)
         print(f"Device: {getattr(midi_port, 'name', 'Unknown')}")
         print("Hot-reloading enabled: Checking for new files every 2s")
         print("Press Ctrl+C to quit.\n")
-        
+
+        midi_queue = queue.SimpleQueue()
+        midi_reader = MidiReaderThread(midi_port, midi_queue)
+        midi_reader.start()
+
+        # Rescan for file changes on a separate thread so its disk I/O
+        # never delays MIDI dispatch.
+        def _rescan_loop():
+            while True:
+                time.sleep(loader.scan_interval)
+                try:
+                    loader.scan_and_update()
+                except Exception as e:
+                    print(f"[ERROR] Rescan error: {e}")
+
+        threading.Thread(target=_rescan_loop, daemon=True, name="rescan").start()
+
         while True:
+            # Block until a MIDI event arrives; the timeout keeps the
+            # loop responsive to signals while the keyboard is idle.
             try:
-                # Poll MIDI
-                msg = midi_port.poll()
-                if msg:
+                msg = midi_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            # Drain any burst that queued up behind this message before
+            # blocking again, so fast playing dispatches back-to-back.
+            while msg is not None:
+                try:
                     handle_midi_message(msg, loader, oled)
-                
-                # Check for file updates
-                loader.scan_and_update()
-                    
-                time.sleep(0.001)
-            except Exception as e:
-                print(f"[ERROR] Main loop error: {e}")
-                time.sleep(0.1)  # Avoid tight error loop
+                except Exception as e:
+                    # Drop the one bad message and keep dispatching; sleeping
+                    # here would silence ~100ms of playable events.
+                    print(f"[ERROR] Main loop error: {e}")
+                try:
+                    msg = midi_queue.get_nowait()
+                except queue.Empty:
+                    msg = None
 
     except KeyboardInterrupt:
         print("\n[EXIT] User interrupt.")
@@ -8,65 +8,153 @@ Starts both the web interface and MIDI sampler together.
 import os
 import sys
 import time
+import select
+import shutil
 import signal
+import socket
+import threading
 import subprocess
 
 # --- Configuration ---
 WEB_SERVER_PORT = 80
-WEB_SERVER_STARTUP_DELAY = 2  # Seconds to wait for server to start
+WEB_SERVER_STARTUP_TIMEOUT = 10  # Max seconds to wait for server to start
+
+# Resolved once at import time - none of these change while we run
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+SERVER_DIR = os.path.join(PROJECT_DIR, "piano-upload")
+SERVER_SCRIPT = os.path.join(SERVER_DIR, "server.js")
+NODE_EXE = shutil.which("node")
 
 # Global reference for cleanup
 web_server_process = None
 
 
-def get_project_dir():
-    """Get the directory where this script is located."""
-    return os.path.dirname(os.path.abspath(__file__))
+def _port_open(port):
+    """Return True if something is already accepting connections on port."""
+    with socket.socket() as s:
+        s.settimeout(0.05)
+        return s.connect_ex(("127.0.0.1", port)) == 0
+
+
+def _wait_for_server(process, port, timeout=WEB_SERVER_STARTUP_TIMEOUT):
+    """Wait until the web server accepts TCP connections.
+
+    Probes the port every 25ms instead of sleeping a fixed delay, so the
+    launcher proceeds the moment the listener is actually up. Returns False
+    if the process dies or the timeout expires first.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            return False
+        if _port_open(port):
+            return True
+        time.sleep(0.025)
+    return False
+
+
+def _pump_output(pipe, out):
+    """Forward a child pipe to one of our streams so the child never blocks."""
+    for line in iter(pipe.readline, b""):
+        out.write(line.decode(errors="replace"))
+    pipe.close()
 
 
-def start_web_server():
-    """Start the Node.js web server in the background."""
+def spawn_web_server():
+    """Launch the Node.js web server without waiting for it to be ready."""
     global web_server_process
-    
-    project_dir = get_project_dir()
-    server_dir = os.path.join(project_dir, "piano-upload")
-    server_script = os.path.join(server_dir, "server.js")
-    
-    if not os.path.exists(server_script):
-        print(f"[ERROR] Web server not found: {server_script}")
+
+    if NODE_EXE is None:
+        print("[ERROR] Node.js not found. Please install Node.js.")
         return False
-    
+
+    # A previous instance (or systemd restart race) may have left the server
+    # running. Reuse it rather than spawning a second Node that would just
+    # die on EADDRINUSE. web_server_process stays None so cleanup() only
+    # ever kills what we spawned ourselves.
+    if _port_open(WEB_SERVER_PORT):
+        print(f"[WEB] Reusing server already listening on port {WEB_SERVER_PORT}")
+        return True
+
     print("[WEB] Starting web server...")
-    
+
     try:
         # Start Node.js server as a subprocess
         web_server_process = subprocess.Popen(
-            ["node", "server.js"],
-            cwd=server_dir,
+            [NODE_EXE, "server.js"],
+            cwd=SERVER_DIR,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
+            # Own process group/session so cleanup can signal Node and any
+            # helpers it spawns in one shot
+            start_new_session=(sys.platform != "win32"),
             creationflags=subprocess.CREATE_NEW_PROCESS_GROUP if sys.platform == "win32" else 0
         )
-        
-        # Wait for server to start
-        time.sleep(WEB_SERVER_STARTUP_DELAY)
-        
-        # Check if process is still running
-        if web_server_process.poll() is not None:
-            print("[ERROR] Web server failed to start!")
-            return False
-        
-        print(f"[WEB] Server running at http://localhost:{WEB_SERVER_PORT}")
+
+        # Drain both pipes: once Node has written ~64KB into an unread OS
+        # pipe buffer, its writes block and the server stalls. Forwarding
+        # the output also keeps its logs visible in ours.
+        threading.Thread(target=_pump_output,
+                         args=(web_server_process.stdout, sys.stdout),
+                         daemon=True).start()
+        threading.Thread(target=_pump_output,
+                         args=(web_server_process.stderr, sys.stderr),
+                         daemon=True).start()
         return True
-        
+
     except FileNotFoundError:
-        print("[ERROR] Node.js not found. Please install Node.js.")
+        # Only stat the script on the failure path; the happy path should
+        # not pay for a pre-flight check Popen repeats anyway.
+        if not os.path.exists(SERVER_SCRIPT):
+            print(f"[ERROR] Web server not found: {SERVER_SCRIPT}")
+        else:
+            print("[ERROR] Node.js not found. Please install Node.js.")
         return False
     except Exception as e:
         print(f"[ERROR] Failed to start web server: {e}")
         return False
 
 
+def wait_web_server():
+    """Block until the spawned web server is accepting connections."""
+    if web_server_process is None:
+        # Nothing spawned: either startup failed, or we are reusing an
+        # already-running server - the port probe tells the two apart.
+        return _port_open(WEB_SERVER_PORT)
+
+    # Fails fast if the process died while we were initializing
+    if not _wait_for_server(web_server_process, WEB_SERVER_PORT):
+        print("[ERROR] Web server failed to start!")
+        return False
+
+    print(f"[WEB] Server running at http://localhost:{WEB_SERVER_PORT}")
+    return True
+
+
+def _wait_with_timeout(proc, timeout):
+    """Wait for proc to exit, sleeping in the kernel rather than polling.
+
+    Popen.wait(timeout=...) re-polls the child on a backoff loop; a pidfd
+    lets select() block until the exact instant the child exits. Falls
+    back to the stock wait where pidfd_open is unavailable (non-Linux,
+    or the child already got reaped). Raises subprocess.TimeoutExpired
+    like the stock wait does.
+    """
+    if not hasattr(os, "pidfd_open"):
+        return proc.wait(timeout=timeout)
+    try:
+        fd = os.pidfd_open(proc.pid)
+    except OSError:
+        return proc.wait(timeout=timeout)
+    try:
+        ready, _, _ = select.select([fd], [], [], timeout)
+        if not ready:
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+    finally:
+        os.close(fd)
+    return proc.wait()
+
+
 def cleanup():
     """Stop the web server process."""
     global web_server_process
@@ -77,28 +165,67 @@ def cleanup():
             if sys.platform == "win32":
                 web_server_process.terminate()
             else:
-                web_server_process.send_signal(signal.SIGTERM)
-            web_server_process.wait(timeout=5)
+                # One signal to the whole process group reaps Node and any
+                # workers server.js may have spawned, atomically.
+                os.killpg(os.getpgid(web_server_process.pid), signal.SIGTERM)
+            _wait_with_timeout(web_server_process, timeout=5)
             print("[CLEANUP] Web server stopped.")
         except Exception as e:
             print(f"[CLEANUP] Force killing web server: {e}")
-            web_server_process.kill()
+            try:
+                if sys.platform == "win32":
+                    web_server_process.kill()
+                else:
+                    os.killpg(os.getpgid(web_server_process.pid), signal.SIGKILL)
+            except Exception:
+                pass
         web_server_process = None
 
 
+def _signal_handler(signum, frame):
+    """Terminate the web server before exiting on a fatal signal."""
+    print(f"\n[EXIT] Received signal {signum}, shutting down...")
+    # Restore the default so a second signal can force-kill immediately
+    signal.signal(signum, signal.SIG_DFL)
+    cleanup()
+    sys.exit(128 + signum)
+
+
+def setup_signal_handlers():
+    """Register handlers so cleanup runs under systemd/supervisor stops.
+
+    Without these, a SIGTERM (the normal systemd stop signal) would kill
+    the launcher without cleanup(), orphaning the Node process and leaving
+    the port busy for the next start.
+    """
+    if hasattr(signal, 'SIGTERM'):
+        signal.signal(signal.SIGTERM, _signal_handler)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, _signal_handler)
+    # Windows Ctrl+Break
+    if hasattr(signal, 'SIGBREAK'):
+        signal.signal(signal.SIGBREAK, _signal_handler)
+
+
 def main():
     """Main entry point."""
     print("=" * 50)
     print("     LA JINGLE BOX 2.0 - Unified Launcher")
     print("=" * 50)
 
+    setup_signal_handlers()
+
     try:
+        # Spawn Node first, so V8's boot overlaps the heavy pygame import
+        # and the sampler's audio/MIDI init instead of running after them.
+        spawn_web_server()
+
         # Import here to avoid loading pygame until needed
         from midi_sampler import main as sampler_main
 
-        # Run MIDI sampler, passing web server start as a hook
-        # so it appears in the OLED loading progress bar
-        sampler_main(pre_load_hook=start_web_server)
+        # Run MIDI sampler, passing the readiness wait as a hook so it
+        # appears in the OLED loading progress bar
+        sampler_main(pre_load_hook=wait_web_server)
 
     except KeyboardInterrupt:
         print("\n[EXIT] Shutting down...")